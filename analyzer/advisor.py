@@ -7,7 +7,8 @@ from analyzer.score import calculate_overall_score
 
 
 
-from analyzer.explain_analyzer import analyze_explain_analyze
+from analyzer.explain_analyzer import analyze_plan
+from analyzer.workload import detect_workload_opportunities, fingerprint_query
 from analyzer.rules import (
     detect_select_star,
     detect_missing_where,
@@ -53,7 +54,7 @@ def generate_ai_explanation(issue_text: str, enabled: bool = False) -> str | Non
 
 
 # ---------------- Main SQL analyzer ----------------
-def analyze(expression, add_ai_explanations=False):
+def analyze(expression, add_ai_explanations=False, dialect=None):
     issues = []
     main_table = get_from_table(expression)
 
@@ -120,7 +121,7 @@ def analyze(expression, add_ai_explanations=False):
         col = item.get("column")
         pattern = item.get("pattern")
 
-        optimized_sql = generate_optimized_condition(item)
+        optimized_sql = generate_optimized_condition(item, dialect)
         msg = f"Non-SARGable condition on {table}.{col}"
 
         issues.append({
@@ -134,20 +135,28 @@ def analyze(expression, add_ai_explanations=False):
 
 
 
-    rewritten_sql = rewrite_query(expression, non_sargable)
+    rewritten_sql = rewrite_query(expression, non_sargable, dialect)
 
     return issues, rewritten_sql
 
 
 # ---------------- SQL + EXPLAIN Analyzer ----------------
-def analyze_with_explain(expression, explain_text=None, add_ai_explanations=False):
-    issues, rewritten_sql = analyze(expression, add_ai_explanations)
+def analyze_with_explain(expression, explain_text=None, add_ai_explanations=False, dialect=None, workload=None):
+    issues, rewritten_sql = analyze(expression, add_ai_explanations, dialect)
 
     score = None
     if explain_text:
-        score, explain_issues = analyze_explain_analyze(explain_text)
+        score, explain_issues = analyze_plan(explain_text, dialect)
         issues.extend(explain_issues)
 
+    # Workload-level findings that concern this query's fingerprint
+    if workload:
+        fingerprint, _ = fingerprint_query(expression, dialect)
+        for issue in detect_workload_opportunities(workload, dialect):
+            if issue["fingerprint"] == fingerprint:
+                issue["ai_explanation"] = generate_ai_explanation(issue["message"], add_ai_explanations)
+                issues.append(issue)
+
     overall_score = calculate_overall_score(issues)
 
     return {
@@ -155,3 +164,17 @@ def analyze_with_explain(expression, explain_text=None, add_ai_explanations=Fals
         "issues": issues,
         "rewritten_sql": rewritten_sql
     }
+
+
+# ---------------- Workload Analyzer ----------------
+def analyze_workload(workload, add_ai_explanations=False, dialect=None):
+    issues = detect_workload_opportunities(workload, dialect)
+    for issue in issues:
+        issue["ai_explanation"] = generate_ai_explanation(issue["message"], add_ai_explanations)
+
+    return {
+        "issues": issues,
+        "estimated_time_saved_ms_per_hour": sum(
+            issue["estimated_time_saved_ms_per_hour"] for issue in issues
+        )
+    }
@@ -17,6 +17,8 @@ def calculate_confidence(issue_type: str, severity: str) -> int:
         "JOIN_EXPLOSION_RISK": 5,
         "INDEX_SUGGESTION": 0,
         "OVER_FETCHING": 0,
+        "MATERIALIZED_VIEW_OPPORTUNITY": 5,
+        "RESULT_CACHE_OPPORTUNITY": 0,
     }
 
     return min(100, base + boosts.get(issue_type, 0))
@@ -1,5 +1,7 @@
 # analyzer/explain_analyzer.py
 import re
+from analyzer.explain_mysql import analyze_mysql_explain
+from analyzer.explain_sqlite import analyze_sqlite_query_plan
 
 def analyze_explain_analyze(explain_text: str):
     """
@@ -69,3 +71,32 @@ def analyze_explain_analyze(explain_text: str):
         })
 
     return max(score, 0), findings
+
+
+# ---------------- Plan analyzer registry ----------------
+# Keys are sqlglot dialect names; None means the historical PostgreSQL default.
+PLAN_ANALYZERS = {
+    None: analyze_explain_analyze,
+    "postgres": analyze_explain_analyze,
+    "mysql": analyze_mysql_explain,
+    "sqlite": analyze_sqlite_query_plan,
+}
+
+
+def register_plan_analyzer(dialect: str, analyzer):
+    """
+    Register a plan analyzer for a dialect.
+    The analyzer takes explain text and returns (score:int, findings:list)
+    """
+    PLAN_ANALYZERS[dialect] = analyzer
+
+
+def analyze_plan(explain_text: str, dialect: str | None = None):
+    """
+    Dispatch EXPLAIN output to the analyzer registered for the dialect
+    Returns: (score:int, findings:list)
+    """
+    analyzer = PLAN_ANALYZERS.get(dialect)
+    if analyzer is None:
+        raise ValueError(f"No plan analyzer for dialect: {dialect}")
+    return analyzer(explain_text)
@@ -0,0 +1,255 @@
+# analyzer/explain_mysql.py
+import json
+import re
+
+ROWS_EXAMINED_THRESHOLD = 10000
+
+
+def analyze_mysql_explain(explain_text: str):
+    """
+    Analyze MySQL EXPLAIN FORMAT=JSON, EXPLAIN ANALYZE (tree) or classic
+    tabular EXPLAIN output (grid or vertical \\G)
+    Returns: (score:int, findings:list)
+    """
+    score = 100
+    findings = []
+
+    if not explain_text:
+        return score, findings
+
+    try:
+        plan = json.loads(explain_text)
+    except ValueError:
+        plan = None
+
+    if isinstance(plan, dict):
+        facts = _collect_json_facts(plan)
+    elif re.search(r"^\s*->", explain_text, re.MULTILINE):
+        facts = _collect_tree_facts(explain_text)
+    else:
+        rows = _parse_tabular_rows(explain_text)
+        if not rows:
+            findings.append({
+                "type": "UNRECOGNIZED_PLAN",
+                "severity": "LOW",
+                "message": "Unrecognized MySQL plan format; the plan was not analyzed",
+                "suggestion": "Paste EXPLAIN FORMAT=JSON, EXPLAIN ANALYZE or tabular EXPLAIN output",
+                "ai_explanation": None
+            })
+            return score, findings
+        facts = _collect_tabular_facts(rows)
+
+    # 1️⃣ Full table scan (type: ALL / Table scan on ...)
+    if facts["full_scans"]:
+        tables = ", ".join(facts["full_scans"])
+        label = "Table scan" if facts["format"] == "tree" else "type: ALL"
+        score -= 25
+        findings.append({
+            "type": "SEQ_SCAN",
+            "severity": "HIGH",
+            "message": f"Full table scan ({label}) on {tables}",
+            "suggestion": "Add an index matching the WHERE / JOIN columns",
+            "ai_explanation": None
+        })
+
+    # 2️⃣ Rows examined per scan
+    if facts["rows_examined"]:
+        table, rows = max(facts["rows_examined"], key=lambda item: item[1])
+        score -= 15
+        findings.append({
+            "type": "HIGH_ROWS_EXAMINED",
+            "severity": "MEDIUM",
+            "message": f"{rows} rows examined per scan on {table}",
+            "suggestion": "Use a more selective index or tighten the WHERE clause",
+            "ai_explanation": None
+        })
+
+    # 3️⃣ Using filesort
+    if facts["filesort"]:
+        score -= 10
+        findings.append({
+            "type": "FILESORT",
+            "severity": "MEDIUM",
+            "message": "Using filesort",
+            "suggestion": "Add an index that matches the ORDER BY columns",
+            "ai_explanation": None
+        })
+
+    # 4️⃣ Using temporary
+    if facts["temporary"]:
+        score -= 10
+        findings.append({
+            "type": "TEMPORARY_TABLE",
+            "severity": "MEDIUM",
+            "message": "Using temporary table",
+            "suggestion": "Index the GROUP BY / DISTINCT columns to avoid a temporary table",
+            "ai_explanation": None
+        })
+
+    # 5️⃣ Execution time (EXPLAIN ANALYZE only)
+    exec_time = facts["exec_time"]
+    if exec_time is not None and exec_time > 500:
+        score -= 20
+        findings.append({
+            "type": "SLOW_QUERY",
+            "severity": "HIGH",
+            "message": f"Execution time is {exec_time} ms",
+            "suggestion": "Optimize query or add proper indexes",
+            "ai_explanation": None
+        })
+
+    # 6️⃣ Bad row estimates (EXPLAIN ANALYZE only)
+    if facts["bad_estimate"]:
+        score -= 20
+        findings.append({
+            "type": "BAD_ESTIMATE",
+            "severity": "MEDIUM",
+            "message": "Actual rows far exceed optimizer estimate",
+            "suggestion": "Run ANALYZE TABLE or add histograms",
+            "ai_explanation": None
+        })
+
+    return max(score, 0), findings
+
+
+def _empty_facts(plan_format):
+    return {
+        "format": plan_format,
+        "full_scans": [],
+        "rows_examined": [],
+        "filesort": False,
+        "temporary": False,
+        "exec_time": None,
+        "bad_estimate": False,
+    }
+
+
+def _collect_json_facts(plan):
+    facts = _empty_facts("json")
+
+    def walk(node):
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+            return
+        if not isinstance(node, dict):
+            return
+
+        if node.get("using_filesort") is True:
+            facts["filesort"] = True
+        if node.get("using_temporary_table") is True:
+            facts["temporary"] = True
+
+        table = node.get("table")
+        if isinstance(table, dict):
+            name = table.get("table_name", "unknown_table")
+            if str(table.get("access_type", "")).upper() == "ALL":
+                facts["full_scans"].append(name)
+
+            try:
+                rows = int(table.get("rows_examined_per_scan", 0))
+            except (TypeError, ValueError):
+                rows = 0
+            if rows >= ROWS_EXAMINED_THRESHOLD:
+                facts["rows_examined"].append((name, rows))
+
+        for value in node.values():
+            walk(value)
+
+    walk(plan)
+    return facts
+
+
+def _collect_tree_facts(explain_text):
+    facts = _empty_facts("tree")
+
+    for line in explain_text.splitlines():
+        node = line.strip().lstrip("->").strip()
+        upper = node.upper()
+
+        scan = re.match(r"table scan on\s+`?(\w+)`?", node, re.IGNORECASE)
+        if scan:
+            facts["full_scans"].append(scan.group(1))
+
+        if upper.startswith("SORT") and "USING INDEX" not in upper:
+            facts["filesort"] = True
+        if "TEMPORARY" in upper or upper.startswith("MATERIALIZE"):
+            facts["temporary"] = True
+
+        estimate = re.search(r"\(COST=[\d\.E\+]+ ROWS=([\d\.E\+]+)\)", upper)
+        actual = re.search(r"\(ACTUAL TIME=[\d\.]+\.\.([\d\.]+) ROWS=([\d\.E\+]+) LOOPS=(\d+)\)", upper)
+        if actual:
+            # First node carrying actual timing is the root of the tree
+            if facts["exec_time"] is None:
+                facts["exec_time"] = float(actual.group(1))
+
+            actual_rows = float(actual.group(2))
+            if estimate and actual_rows > float(estimate.group(1)) * 5:
+                facts["bad_estimate"] = True
+
+            if scan and actual_rows * int(actual.group(3)) >= ROWS_EXAMINED_THRESHOLD:
+                facts["rows_examined"].append(
+                    (scan.group(1), int(actual_rows * int(actual.group(3))))
+                )
+
+    return facts
+
+
+def _parse_tabular_rows(explain_text):
+    """
+    Parse classic EXPLAIN output into row dicts keyed by lower-case column name.
+    Handles the mysql client grid (| id | ... |), tab-separated batch output
+    and the vertical \\G format (type: ALL).
+    """
+    lines = [line for line in explain_text.splitlines() if line.strip()]
+
+    # Vertical format: "*** 1. row ***" followed by "key: value" lines
+    if any(re.match(r"^\*+ \d+\. row \*+$", line.strip()) for line in lines):
+        rows = []
+        for line in lines:
+            if re.match(r"^\*+ \d+\. row \*+$", line.strip()):
+                rows.append({})
+            elif rows and ":" in line:
+                key, _, value = line.partition(":")
+                rows[-1][key.strip().lower()] = value.strip()
+        return [row for row in rows if "type" in row]
+
+    # Grid / tab-separated format: first row with a "type" column is the header
+    header = None
+    rows = []
+    for line in lines:
+        if line.strip().startswith("+"):
+            continue
+        delimiter = "|" if "|" in line else "\t"
+        cells = [cell.strip() for cell in line.strip().strip("|").split(delimiter)]
+        if header is None:
+            if "type" in [cell.lower() for cell in cells]:
+                header = [cell.lower() for cell in cells]
+            continue
+        if len(cells) == len(header):
+            rows.append(dict(zip(header, cells)))
+    return rows
+
+
+def _collect_tabular_facts(rows):
+    facts = _empty_facts("table")
+
+    for row in rows:
+        name = row.get("table") or "unknown_table"
+        extra = row.get("extra", "").upper()
+
+        if row.get("type", "").upper() == "ALL":
+            facts["full_scans"].append(name)
+        if "USING FILESORT" in extra:
+            facts["filesort"] = True
+        if "USING TEMPORARY" in extra:
+            facts["temporary"] = True
+
+        try:
+            examined = int(row.get("rows", 0))
+        except ValueError:
+            examined = 0
+        if examined >= ROWS_EXAMINED_THRESHOLD:
+            facts["rows_examined"].append((name, examined))
+
+    return facts
@@ -0,0 +1,69 @@
+# analyzer/explain_sqlite.py
+import re
+
+
+def analyze_sqlite_query_plan(explain_text: str):
+    """
+    Analyze SQLite EXPLAIN QUERY PLAN output
+    Returns: (score:int, findings:list)
+    """
+    score = 100
+    findings = []
+
+    if not explain_text:
+        return score, findings
+
+    full_scans = []
+    temp_btrees = []
+    automatic_index = False
+
+    for line in explain_text.splitlines():
+        # Strip tree drawing ("|--", "`--") and legacy "id|parent|notused|" prefixes
+        raw = re.sub(r"^[\s\|`\-\d]*", "", line)
+        detail = raw.upper()
+
+        scan = re.match(r"SCAN (?:TABLE )?(\w+)(.*)", raw, re.IGNORECASE)
+        if scan and scan.group(1).upper() not in ("CONSTANT", "SUBQUERY") and "INDEX" not in scan.group(2).upper():
+            full_scans.append(scan.group(1))
+
+        temp = re.match(r"USE TEMP B-TREE FOR (.+)", detail)
+        if temp:
+            temp_btrees.append(temp.group(1).strip())
+
+        if "AUTOMATIC" in detail and "INDEX" in detail:
+            automatic_index = True
+
+    # 1️⃣ SCAN without an index
+    if full_scans:
+        score -= 25
+        findings.append({
+            "type": "SEQ_SCAN",
+            "severity": "HIGH",
+            "message": f"Full table scan on {', '.join(full_scans)}",
+            "suggestion": "Add an index so SQLite can SEARCH ... USING INDEX",
+            "ai_explanation": None
+        })
+
+    # 2️⃣ Temporary B-tree for ORDER BY / GROUP BY / DISTINCT
+    if temp_btrees:
+        score -= 10
+        findings.append({
+            "type": "TEMP_BTREE",
+            "severity": "MEDIUM",
+            "message": f"Uses temp B-tree for {', '.join(temp_btrees)}",
+            "suggestion": "Add an index that matches the ORDER BY / GROUP BY columns",
+            "ai_explanation": None
+        })
+
+    # 3️⃣ Automatic (transient) index
+    if automatic_index:
+        score -= 15
+        findings.append({
+            "type": "AUTOMATIC_INDEX",
+            "severity": "MEDIUM",
+            "message": "SQLite builds an automatic index at query time",
+            "suggestion": "Create a permanent index on the join / filter columns",
+            "ai_explanation": None
+        })
+
+    return max(score, 0), findings
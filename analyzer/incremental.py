@@ -0,0 +1,146 @@
+import re
+from sqlglot import parse_one
+from analyzer.advisor import analyze
+
+
+# PostgreSQL dollar quoting: $$ or $tag$ (a tag cannot start with a digit, unlike $1)
+DOLLAR_QUOTE = re.compile(r"\$(?:[A-Za-z_]\w*)?\$")
+
+
+def split_statements(sql: str, dialect: str | None = None):
+    """
+    Split a SQL document on top-level semicolons.
+    Quotes, comments and dialect-specific lexing are respected so a ';'
+    inside them does not split: $tag$ bodies for PostgreSQL, backslash
+    escapes and # comments for MySQL. Comment-only chunks are dropped.
+    Returns list of (statement_text, start_offset) with whitespace stripped.
+    """
+    dollar_quotes = dialect in (None, "postgres")
+    mysql = dialect == "mysql"
+
+    statements = []
+    start = 0
+    i = 0
+    n = len(sql)
+    quote = None
+    has_code = False
+
+    while i < n:
+        ch = sql[i]
+        line_comment = sql.startswith("--", i) or (mysql and ch == "#")
+
+        if not quote and not ch.isspace() and not line_comment and not sql.startswith("/*", i):
+            has_code = True
+
+        if quote:
+            if mysql and ch == "\\":
+                # Backslash escapes the next character inside MySQL strings
+                i += 2
+                continue
+            if ch == quote:
+                # Doubled quote is an escaped quote, stay inside the literal
+                if i + 1 < n and sql[i + 1] == quote:
+                    i += 1
+                else:
+                    quote = None
+        elif ch in ("'", '"', "`"):
+            quote = ch
+        elif dollar_quotes and ch == "$" and DOLLAR_QUOTE.match(sql, i):
+            tag = DOLLAR_QUOTE.match(sql, i).group(0)
+            end = sql.find(tag, i + len(tag))
+            i = n if end == -1 else end + len(tag)
+            continue
+        elif line_comment:
+            end = sql.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        elif ch == "/" and sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            continue
+        elif ch == ";":
+            if has_code:
+                _append_statement(statements, sql, start, i)
+            start = i + 1
+            has_code = False
+
+        i += 1
+
+    if has_code:
+        _append_statement(statements, sql, start, n)
+    return statements
+
+
+def _append_statement(statements, sql, start, end):
+    chunk = sql[start:end]
+    stripped = chunk.lstrip()
+    offset = start + (len(chunk) - len(stripped))
+    statements.append((stripped.rstrip(), offset))
+
+
+def analyze_statement(sql: str, dialect: str | None = None):
+    """
+    Parse and analyze a single statement.
+    Returns dict: {issues, original_sql, rewritten_sql, error}
+    original_sql is the statement regenerated by sqlglot, so it can be
+    compared with rewritten_sql to tell whether a rewrite changed anything.
+    """
+    try:
+        expression = parse_one(sql, read=dialect)
+    except Exception as e:
+        return {"issues": [], "original_sql": None, "rewritten_sql": None, "error": f"Invalid SQL: {e}"}
+
+    if expression is None:
+        return {"issues": [], "original_sql": None, "rewritten_sql": None, "error": None}
+
+    # A failure in one statement must not drop diagnostics for the whole document
+    try:
+        issues, rewritten_sql = analyze(expression, dialect=dialect)
+    except Exception as e:
+        return {"issues": [], "original_sql": None, "rewritten_sql": None, "error": f"Analysis failed: {e}"}
+
+    return {
+        "issues": issues,
+        "original_sql": expression.sql(dialect=dialect),
+        "rewritten_sql": rewritten_sql,
+        "error": None
+    }
+
+
+class IncrementalAnalyzer:
+    """
+    Keeps per-document analysis results keyed by statement text.
+    On update only statements whose text changed are parsed and analyzed again.
+    """
+
+    def __init__(self, dialect: str | None = None):
+        self.dialect = dialect
+        self.documents = {}
+
+    def update(self, uri: str, text: str):
+        """
+        Re-analyze a document, reusing cached results for unchanged statements.
+        Returns list of dicts: {sql, start, end, issues, original_sql, rewritten_sql, error}
+        """
+        previous = self.documents.get(uri, {})
+        cache = {}
+        results = []
+
+        for sql, start in split_statements(text, self.dialect):
+            result = previous.get(sql) or cache.get(sql)
+            if result is None:
+                result = analyze_statement(sql, self.dialect)
+            cache[sql] = result
+
+            results.append({
+                "sql": sql,
+                "start": start,
+                "end": start + len(sql),
+                **result
+            })
+
+        self.documents[uri] = cache
+        return results
+
+    def close(self, uri: str):
+        self.documents.pop(uri, None)
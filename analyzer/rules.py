@@ -52,34 +52,55 @@ def detect_non_sargable_patterns(expression, default_table=None):
     if not expression:
         return []
 
-    issues = []
+    return [info for _, info in _non_sargable_comparisons(expression, default_table)]
 
+# Dialect readers normalize some functions, e.g. MySQL DATE(col) -> TsOrDsToDate
+FUNCTION_ALIASES = {
+    "TS_OR_DS_TO_DATE": "DATE",
+}
+
+def _non_sargable_comparisons(expression, default_table=None):
+    """Yield (comparison_node, pattern_info) for every func(col) <op> value in WHERE"""
     for where in expression.find_all(exp.Where):
         for func in where.find_all(exp.Func):
-            col = func.this
-            col_name = getattr(col, "name", None)
-            table_name = getattr(col, "table", None) or default_table or "unknown_table"
-
-            # Try to extract comparison value if exists
-            val = None
-            parent = getattr(func, "parent", None)
-            if parent and hasattr(parent, "args"):
-                val_expr = parent.args.get("expression")
-                if val_expr:
-                    val = val_expr.sql().strip("'")
-
-            if col_name:
-                issues.append({
-                    "table": table_name,
-                    "column": col_name,
-                    "pattern": func.name.upper(),
-                    "value": val
-                })
-    return issues
+            parent = func.parent
+            if not isinstance(parent, exp.Predicate) or parent.this is not func:
+                continue
 
-def generate_optimized_condition(pattern_info):
+            # Unwrap only the cast a dialect reader inserts directly around the
+            # column (MySQL YEAR(col) -> Year(TsOrDsToDate(col))). Any other
+            # nested function changes the meaning, so it is not rewritten.
+            col = func.this
+            if isinstance(col, (exp.TsOrDsToDate, exp.Cast)) and isinstance(col.this, exp.Column):
+                col = col.this
+            if not isinstance(col, exp.Column):
+                continue
+
+            # Only literal values can be turned into an index-friendly range
+            val_expr = parent.args.get("expression")
+            val = val_expr.name if isinstance(val_expr, exp.Literal) else None
+
+            pattern = func.sql_name().upper()
+            yield parent, {
+                "table": col.table or default_table or "unknown_table",
+                "column": col.name,
+                "pattern": FUNCTION_ALIASES.get(pattern, pattern),
+                "value": val
+            }
+
+def generate_optimized_condition(pattern_info, dialect=None):
     """
     Given pattern info {pattern, column, value}, returns an optimized SQL snippet
+    for the target dialect (PostgreSQL when dialect is None)
+    """
+    condition = build_optimized_condition(pattern_info, dialect=dialect)
+    return condition.sql(dialect=dialect) if condition else None
+
+def build_optimized_condition(pattern_info, column=None, dialect=None):
+    """
+    Build the index-friendly condition as a sqlglot node, so values are quoted
+    by sqlglot rather than pasted into SQL text.
+    column defaults to an unqualified column named pattern_info["column"].
     """
     pattern = pattern_info.get("pattern")
     col = pattern_info.get("column")
@@ -88,18 +109,30 @@ def generate_optimized_condition(pattern_info):
     if not col or not val:
         return None
 
+    column = column or exp.column(col)
+
     try:
         if pattern == "DATE":
             dt = datetime.strptime(val, "%Y-%m-%d")
             start = dt.strftime("%Y-%m-%d 00:00:00")
             end = dt.strftime("%Y-%m-%d 23:59:59")
-            return f"{col} BETWEEN '{start}' AND '{end}'"
+            return exp.Between(this=column, low=exp.Literal.string(start), high=exp.Literal.string(end))
         elif pattern == "YEAR":
             year = int(val)
-            return f"{col} BETWEEN '{year}-01-01 00:00:00' AND '{year}-12-31 23:59:59'"
+            return exp.Between(
+                this=column,
+                low=exp.Literal.string(f"{year}-01-01 00:00:00"),
+                high=exp.Literal.string(f"{year}-12-31 23:59:59"),
+            )
         elif pattern == "UPPER":
-            return f"{col} ILIKE '{val}'"
-    except:
+            value = exp.Literal.string(val)
+            if dialect == "mysql":
+                # Default MySQL collations are already case-insensitive
+                return exp.EQ(this=column, expression=value)
+            if dialect == "sqlite":
+                return exp.EQ(this=column, expression=exp.Collate(this=value, expression=exp.var("NOCASE")))
+            return exp.ILike(this=column, expression=value)
+    except ValueError:
         return None
 
 def get_from_table(expression):
@@ -109,32 +142,33 @@ def get_from_table(expression):
             return table.name
     return "unknown_table"
 
-def rewrite_query(expression, non_sargable_patterns):
+def rewrite_query(expression, non_sargable_patterns, dialect=None):
     """
     Returns a rewritten SQL string where non-SARGable conditions are replaced
-    by optimized forms (range-based or ILIKE for UPPER).
+    by optimized forms (range-based or case-insensitive match for UPPER).
+    The input expression is left untouched.
     """
-    sql = expression.sql()
+    rewritten = expression.copy()
 
-    # Replace patterns in the SQL string
-    for pattern_info in non_sargable_patterns:
-        pattern = pattern_info.get("pattern")
-        col = pattern_info.get("column")
-        val = pattern_info.get("value")
-
-        if not col or not val:
+    for node, pattern_info in list(_non_sargable_comparisons(rewritten)):
+        if not isinstance(node, exp.EQ):
             continue
 
-        optimized = generate_optimized_condition(pattern_info)
-        if not optimized:
+        matches = any(
+            all(pattern_info[key] == item.get(key) for key in ("column", "pattern", "value"))
+            for item in non_sargable_patterns
+        )
+        if not matches:
             continue
 
-        # Pattern matching replacement (simplified)
-        if pattern == "DATE":
-            sql = sql.replace(f"DATE({col}) = '{val}'", optimized)
-        elif pattern == "YEAR":
-            sql = sql.replace(f"YEAR({col}) = {val}", optimized)
-        elif pattern == "UPPER":
-            sql = sql.replace(f"UPPER({col}) = '{val}'", optimized)
+        # One failed rewrite must not break the rest of the analysis
+        try:
+            # Keep the table qualifier of the original column
+            column = node.this.find(exp.Column).copy()
+            optimized = build_optimized_condition(pattern_info, column, dialect)
+            if optimized:
+                node.replace(optimized)
+        except Exception:
+            continue
 
-    return sql
+    return rewritten.sql(dialect=dialect)
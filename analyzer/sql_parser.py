@@ -1,7 +1,7 @@
 import sqlglot
 
-def parse_sql(sql: str):
+def parse_sql(sql: str, dialect: str | None = None):
     try:
-        return sqlglot.parse_one(sql)
+        return sqlglot.parse_one(sql, read=dialect)
     except Exception:
         return None
@@ -0,0 +1,212 @@
+import hashlib
+import re
+from sqlglot import exp, parse_one
+from analyzer.confidence import calculate_confidence
+
+MIN_CALLS_PER_HOUR = 60
+MIN_MEAN_TIME_MS = 50
+MIN_SAVED_MS_PER_HOUR = 5000
+
+
+def is_parameter(node):
+    """True for bind parameters: ?, :name, $1 (the default dialect reads $1 as a column)"""
+    if isinstance(node, (exp.Placeholder, exp.Parameter)):
+        return True
+    return isinstance(node, exp.Column) and bool(re.fullmatch(r"\$\d+", node.name))
+
+
+def _normalize(node):
+    if isinstance(node, exp.Literal) or is_parameter(node):
+        return exp.Placeholder()
+    if isinstance(node, exp.Neg) and isinstance(node.this, exp.Literal):
+        return exp.Placeholder()
+    # `orders`, "Orders" and orders are the same table for fingerprinting
+    if isinstance(node, exp.Identifier):
+        return exp.Identifier(this=node.name.lower(), quoted=False)
+    # transform() does not descend into a replacement node, so normalize its children here.
+    # IN (1, 2) and IN (1, 2, 3) are the same query shape
+    if isinstance(node, exp.In) and node.expressions:
+        return exp.In(this=node.this.transform(_normalize), expressions=[exp.Placeholder()])
+    # Multi-row VALUES collapse to a single row
+    if isinstance(node, exp.Values) and len(node.expressions) > 1:
+        values = node.copy()
+        values.set("expressions", [node.expressions[0].transform(_normalize)])
+        return values
+    return node
+
+
+def fingerprint_query(expression, dialect=None):
+    """
+    Normalize a parsed query by replacing literals and bind parameters with
+    placeholders, collapsing IN / VALUES lists and unquoting / lowercasing
+    identifiers.
+    The hash is taken over the dialect-neutral rendering, so the same query
+    gets the same fingerprint whatever dialect it was read with.
+    Returns: (fingerprint:str, normalized_sql:str)
+    """
+    normalized_sql = expression.copy().transform(_normalize).sql()
+    fingerprint = hashlib.md5(normalized_sql.encode("utf-8")).hexdigest()[:12]
+    return fingerprint, normalized_sql
+
+
+def _query_shape(expression):
+    """Return which expensive, reusable constructs a read query contains"""
+    # Table names are lowercased, matching fingerprint_query and the write-rate lookup
+    cte_names = {cte.alias.lower() for cte in expression.find_all(exp.CTE)}
+    return {
+        "aggregate": bool(expression.find(exp.Group) or expression.find(exp.AggFunc)),
+        "join": bool(expression.find(exp.Join)),
+        "subquery": bool(expression.find(exp.Subquery)),
+        "tables": sorted({
+            table.name.lower() for table in expression.find_all(exp.Table)
+            if table.name and table.name.lower() not in cte_names
+        }),
+    }
+
+
+def collect_workload(workload, dialect=None):
+    """
+    Group workload queries by fingerprint.
+    workload: {queries: [{sql, calls, mean_time_ms}], window_hours}
+    Returns dict: fingerprint -> {expression, normalized_sql, calls_per_hour, mean_time_ms}
+    Raises ValueError when window_hours is not a positive number.
+    """
+    window_hours = workload.get("window_hours", 1)
+    if window_hours is None or window_hours <= 0:
+        raise ValueError(f"window_hours must be positive, got {window_hours}")
+    groups = {}
+
+    for query in workload.get("queries", []):
+        try:
+            expression = parse_one(query["sql"], read=dialect)
+        except Exception:
+            continue
+
+        # Only read queries can be served from a view or cache
+        if not isinstance(expression, (exp.Select, exp.Union)):
+            continue
+
+        calls = query.get("calls", 0)
+        mean_time_ms = query.get("mean_time_ms", 0)
+        fingerprint, normalized_sql = fingerprint_query(expression, dialect)
+
+        group = groups.setdefault(fingerprint, {
+            "expression": expression,
+            "normalized_sql": normalized_sql,
+            "variants": set(),
+            "calls": 0,
+            "total_time_ms": 0.0,
+        })
+        group["variants"].add(expression.sql(dialect=dialect))
+        group["calls"] += calls
+        group["total_time_ms"] += calls * mean_time_ms
+
+    for group in groups.values():
+        group["calls_per_hour"] = group["calls"] / window_hours
+        group["mean_time_ms"] = group["total_time_ms"] / group["calls"] if group["calls"] else 0.0
+
+    return groups
+
+
+def detect_workload_opportunities(workload, dialect=None):
+    """
+    Find repeated expensive read queries over slowly changing tables that
+    should be served from a materialized view, summary table or result cache.
+    workload: {queries, window_hours, table_writes_per_hour}
+    Returns list of workload-level issues
+    """
+    if not workload:
+        return []
+
+    writes_per_hour = {
+        table.lower(): rate for table, rate in (workload.get("table_writes_per_hour") or {}).items()
+    }
+    issues = []
+
+    for fingerprint, group in collect_workload(workload, dialect).items():
+        calls_per_hour = group["calls_per_hour"]
+        mean_time_ms = group["mean_time_ms"]
+        if calls_per_hour < MIN_CALLS_PER_HOUR or mean_time_ms < MIN_MEAN_TIME_MS:
+            continue
+
+        shape = _query_shape(group["expression"])
+        if not (shape["aggregate"] or shape["join"] or shape["subquery"]):
+            continue
+
+        # Every write to an underlying table forces a refresh / invalidation.
+        # Without write stats assume one refresh per hour.
+        known_rates = [writes_per_hour[t] for t in shape["tables"] if t in writes_per_hour]
+        refreshes_per_hour = sum(known_rates) if known_rates else 1
+        if refreshes_per_hour >= calls_per_hour:
+            continue
+
+        saved_ms = round((calls_per_hour - refreshes_per_hour) * mean_time_ms)
+        if saved_ms < MIN_SAVED_MS_PER_HOUR:
+            continue
+
+        severity = (
+            "HIGH" if saved_ms >= 60000
+            else "MEDIUM" if saved_ms >= 10000
+            else "LOW"
+        )
+
+        issue_type, suggestion = _recommendation(fingerprint, group, shape, dialect)
+        confidence = calculate_confidence(issue_type, severity)
+        if len(known_rates) < len(shape["tables"]):
+            confidence -= 10
+
+        tables = ", ".join(shape["tables"]) or "unknown_table"
+        issues.append({
+            "type": issue_type,
+            "severity": severity,
+            "message": (
+                f"Query {fingerprint} runs {calls_per_hour:.0f}x/hour at "
+                f"{mean_time_ms:.0f} ms reading {tables}; "
+                f"~{saved_ms / 1000:.1f} s/hour could be saved"
+            ),
+            "suggestion": suggestion,
+            "confidence": confidence,
+            "ai_explanation": None,
+            "scope": "workload",
+            "fingerprint": fingerprint,
+            "calls_per_hour": round(calls_per_hour, 2),
+            "mean_time_ms": round(mean_time_ms, 2),
+            "estimated_time_saved_ms_per_hour": saved_ms,
+        })
+
+    issues.sort(key=lambda issue: issue["estimated_time_saved_ms_per_hour"], reverse=True)
+    return issues
+
+
+def _recommendation(fingerprint, group, shape, dialect):
+    tables = ", ".join(shape["tables"]) or "the source tables"
+
+    if not shape["aggregate"]:
+        return (
+            "RESULT_CACHE_OPPORTUNITY",
+            f"Cache results in the application keyed by query parameters; "
+            f"invalidate on writes to {tables}"
+        )
+
+    # Bind parameters or different literal values across calls:
+    # a single view with baked-in values cannot answer all of them
+    parameterized = any(is_parameter(node) for node in group["expression"].walk())
+    if parameterized or len(group["variants"]) > 1:
+        return (
+            "MATERIALIZED_VIEW_OPPORTUNITY",
+            f"Maintain a summary table at the GROUP BY grain plus the filtered columns; "
+            f"refresh it on writes to {tables}"
+        )
+
+    sql = group["expression"].sql(dialect=dialect)
+    if dialect in (None, "postgres"):
+        return (
+            "MATERIALIZED_VIEW_OPPORTUNITY",
+            f"CREATE MATERIALIZED VIEW mv_{fingerprint} AS {sql}; "
+            f"REFRESH MATERIALIZED VIEW mv_{fingerprint} after writes to {tables}"
+        )
+    return (
+        "MATERIALIZED_VIEW_OPPORTUNITY",
+        f"CREATE TABLE summary_{fingerprint} AS {sql}; "
+        f"rebuild it after writes to {tables}"
+    )
@@ -11,15 +11,16 @@ app = FastAPI(title="SQL Query Optimizer with Gemini AI")
 class QueryRequest(BaseModel):
     query: str
     ai: bool = True  # Enable AI explanations by default
+    dialect: str | None = None
 
 @app.post("/analyze")
 def analyze_query(req: QueryRequest):
     try:
-        expression = parse_one(req.query)
+        expression = parse_one(req.query, read=req.dialect)
     except Exception as e:
         return {"error": f"Invalid SQL: {e}"}
 
-    issues, rewritten_sql = analyze(expression, add_ai_explanations=req.ai)
+    issues, rewritten_sql = analyze(expression, add_ai_explanations=req.ai, dialect=req.dialect)
     return {
         "issues": issues,
         "rewritten_sql": rewritten_sql
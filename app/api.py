@@ -1,26 +1,27 @@
 from fastapi import FastAPI
-from pydantic import BaseModel
 from sqlglot import parse_one
-from analyzer.advisor import analyze_with_explain
+from analyzer.advisor import analyze_with_explain, analyze_workload
+from analyzer.explain_analyzer import PLAN_ANALYZERS
+from app.schemas import AnalyzeRequest, AnalyzeWorkloadRequest
 
 app = FastAPI(title="SQL Query Optimizer")
 
-class AnalyzeRequest(BaseModel):
-    sql: str
-    explain_text: str | None = None
-    add_ai_explanations: bool = False
-
 @app.post("/analyze")
 def analyze_sql(req: AnalyzeRequest):
+    if req.dialect not in PLAN_ANALYZERS:
+        return {"error": f"Unsupported dialect: {req.dialect}"}
+
     try:
-        expression = parse_one(req.sql)
+        expression = parse_one(req.sql, read=req.dialect)
     except Exception as e:
         return {"error": f"Invalid SQL: {e}"}
 
     result = analyze_with_explain(
         expression,
         explain_text=req.explain_text,
-        add_ai_explanations=req.add_ai_explanations
+        add_ai_explanations=req.add_ai_explanations,
+        dialect=req.dialect,
+        workload=req.workload.model_dump() if req.workload else None
     )
 
     return {
@@ -28,3 +29,14 @@ def analyze_sql(req: AnalyzeRequest):
         "issues": result["issues"],
         "rewritten_sql": result["rewritten_sql"],
     }
+
+@app.post("/analyze-workload")
+def analyze_sql_workload(req: AnalyzeWorkloadRequest):
+    if req.dialect not in PLAN_ANALYZERS:
+        return {"error": f"Unsupported dialect: {req.dialect}"}
+
+    return analyze_workload(
+        req.workload.model_dump(),
+        add_ai_explanations=req.add_ai_explanations,
+        dialect=req.dialect
+    )
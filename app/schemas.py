@@ -1,12 +1,32 @@
 # app/schema.py
 
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+
+class WorkloadQuery(BaseModel):
+    sql: str
+    calls: int
+    mean_time_ms: float
+
+
+class Workload(BaseModel):
+    queries: List[WorkloadQuery]
+    window_hours: float = Field(default=1.0, gt=0)
+    table_writes_per_hour: Optional[Dict[str, float]] = None
+
 
 class AnalyzeRequest(BaseModel):
     sql: str
     explain_text: Optional[str] = None
     add_ai_explanations: bool = False
+    dialect: Optional[str] = None  # sqlglot dialect: postgres, mysql, sqlite
+    workload: Optional[Workload] = None
+
+
+class AnalyzeWorkloadRequest(BaseModel):
+    workload: Workload
+    add_ai_explanations: bool = False
+    dialect: Optional[str] = None
 
 class Issue(BaseModel):
     type: str
@@ -15,6 +35,12 @@ class Issue(BaseModel):
     suggestion: str
     confidence: int
     ai_explanation: Optional[str] = None
+    # Workload-level findings only
+    scope: Optional[str] = None
+    fingerprint: Optional[str] = None
+    calls_per_hour: Optional[float] = None
+    mean_time_ms: Optional[float] = None
+    estimated_time_saved_ms_per_hour: Optional[int] = None
 
 
 class AnalyzeResponse(BaseModel):
@@ -22,3 +48,7 @@ class AnalyzeResponse(BaseModel):
     issues: List[Issue]
     rewritten_sql: str
 
+
+class AnalyzeWorkloadResponse(BaseModel):
+    issues: List[Issue]
+    estimated_time_saved_ms_per_hour: int
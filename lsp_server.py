@@ -0,0 +1,240 @@
+import json
+import sys
+from analyzer.incremental import IncrementalAnalyzer
+
+# LSP DiagnosticSeverity: 1=Error, 2=Warning, 3=Information
+SEVERITY_MAP = {
+    "HIGH": 1,
+    "MEDIUM": 2,
+    "LOW": 3,
+}
+
+SOURCE = "sql-performance-advisor"
+
+
+# ---------------- JSON-RPC over stdio ----------------
+def read_message(stream):
+    headers = {}
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.decode("ascii").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+    if not length:
+        return None
+    return json.loads(stream.read(length).decode("utf-8"))
+
+
+def write_message(stream, payload):
+    body = json.dumps(payload).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii"))
+    stream.write(body)
+    stream.flush()
+
+
+# ---------------- Position helpers ----------------
+def offset_to_position(text: str, offset: int):
+    """Convert a code point offset to an LSP position (UTF-16 code units)"""
+    line = text.count("\n", 0, offset)
+    line_start = text.rfind("\n", 0, offset) + 1
+    character = len(text[line_start:offset].encode("utf-16-le")) // 2
+    return {"line": line, "character": character}
+
+
+def statement_range(text: str, statement):
+    return {
+        "start": offset_to_position(text, statement["start"]),
+        "end": offset_to_position(text, statement["end"]),
+    }
+
+
+def ranges_overlap(a, b):
+    def key(pos):
+        return (pos["line"], pos["character"])
+
+    return key(a["start"]) <= key(b["end"]) and key(b["start"]) <= key(a["end"])
+
+
+# ---------------- Language server ----------------
+class SqlLanguageServer:
+    def __init__(self, stdin, stdout):
+        self.stdin = stdin
+        self.stdout = stdout
+        self.analyzer = IncrementalAnalyzer()
+        self.texts = {}
+        self.statements = {}
+        self.running = True
+
+    def serve(self):
+        while self.running:
+            message = read_message(self.stdin)
+            if message is None:
+                break
+            self.dispatch(message)
+
+    def dispatch(self, message):
+        method = message.get("method")
+        params = message.get("params") or {}
+        handler = {
+            "initialize": self.on_initialize,
+            "shutdown": self.on_shutdown,
+            "exit": self.on_exit,
+            "textDocument/didOpen": self.on_did_open,
+            "textDocument/didChange": self.on_did_change,
+            "textDocument/didClose": self.on_did_close,
+            "textDocument/codeAction": self.on_code_action,
+        }.get(method)
+
+        if "id" not in message:
+            # Notification: no response expected, but never let it kill the server
+            if handler:
+                try:
+                    handler(params)
+                except Exception as e:
+                    print(f"{SOURCE}: {method} failed: {e!r}", file=sys.stderr)
+            return
+
+        if handler is None:
+            self.respond_error(message["id"], -32601, f"Method not found: {method}")
+            return
+
+        try:
+            result = handler(params)
+        except Exception as e:
+            self.respond_error(message["id"], -32603, str(e))
+            return
+        write_message(self.stdout, {"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    def respond_error(self, request_id, code, text):
+        write_message(self.stdout, {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": text}
+        })
+
+    # ---- lifecycle ----
+    def on_initialize(self, params):
+        options = params.get("initializationOptions") or {}
+        if options.get("dialect"):
+            self.analyzer = IncrementalAnalyzer(dialect=options["dialect"])
+
+        return {
+            "capabilities": {
+                # Full sync: the client sends the whole text, we diff by statement
+                "textDocumentSync": 1,
+                "codeActionProvider": True,
+            },
+            "serverInfo": {"name": SOURCE},
+        }
+
+    def on_shutdown(self, params):
+        return None
+
+    def on_exit(self, params):
+        self.running = False
+
+    # ---- documents ----
+    def on_did_open(self, params):
+        doc = params["textDocument"]
+        self.refresh(doc["uri"], doc["text"])
+
+    def on_did_change(self, params):
+        changes = params.get("contentChanges") or []
+        if changes:
+            self.refresh(params["textDocument"]["uri"], changes[-1]["text"])
+
+    def on_did_close(self, params):
+        uri = params["textDocument"]["uri"]
+        self.analyzer.close(uri)
+        self.texts.pop(uri, None)
+        self.statements.pop(uri, None)
+        self.publish(uri, [])
+
+    def refresh(self, uri, text):
+        statements = self.analyzer.update(uri, text)
+        self.texts[uri] = text
+        self.statements[uri] = statements
+        self.publish(uri, build_diagnostics(text, statements))
+
+    def publish(self, uri, diagnostics):
+        write_message(self.stdout, {
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "diagnostics": diagnostics}
+        })
+
+    # ---- code actions ----
+    def on_code_action(self, params):
+        uri = params["textDocument"]["uri"]
+        text = self.texts.get(uri)
+        if text is None:
+            return []
+        return build_code_actions(uri, text, self.statements.get(uri, []), params["range"])
+
+
+def build_diagnostics(text, statements):
+    diagnostics = []
+    for statement in statements:
+        rng = statement_range(text, statement)
+
+        if statement["error"]:
+            diagnostics.append({
+                "range": rng,
+                "severity": 1,
+                "source": SOURCE,
+                "message": statement["error"],
+            })
+            continue
+
+        for issue in statement["issues"]:
+            diagnostics.append({
+                "range": rng,
+                "severity": SEVERITY_MAP.get(issue.get("severity"), 3),
+                "code": issue.get("type"),
+                "source": SOURCE,
+                "message": f"{issue.get('message')}. Fix: {issue.get('suggestion')}",
+            })
+    return diagnostics
+
+
+def build_code_actions(uri, text, statements, request_range):
+    actions = []
+    for statement in statements:
+        has_non_sargable = any(
+            issue.get("type") == "NON_SARGABLE_CONDITION" for issue in statement["issues"]
+        )
+        # Compare against sqlglot's own rendering, not the user's source text,
+        # so a pure reformat is never offered as a fix
+        rewritten_sql = statement.get("rewritten_sql")
+        if not has_non_sargable or not rewritten_sql or rewritten_sql == statement.get("original_sql"):
+            continue
+
+        rng = statement_range(text, statement)
+        if not ranges_overlap(rng, request_range):
+            continue
+
+        actions.append({
+            "title": "Rewrite query with SARGable conditions",
+            "kind": "quickfix",
+            "edit": {
+                "changes": {
+                    uri: [{"range": rng, "newText": rewritten_sql}]
+                }
+            },
+        })
+    return actions
+
+
+def main():
+    server = SqlLanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    server.serve()
+
+
+if __name__ == "__main__":
+    main()
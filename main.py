@@ -6,6 +6,13 @@ from utils.diff import sql_diff
 # 🔥 Force ANSI colors on Windows
 init(autoreset=True, strip=False, convert=False)
 
+# Supported dialects and the plan output each one expects
+DIALECTS = {
+    "postgres": "EXPLAIN ANALYZE",
+    "mysql": "EXPLAIN FORMAT=JSON / EXPLAIN ANALYZE",
+    "sqlite": "EXPLAIN QUERY PLAN",
+}
+
 
 def pretty_print_issue(issue):
     print("\n" + Fore.YELLOW + "⚠ " + issue.get("type", "UNKNOWN"))
@@ -38,10 +45,15 @@ def main():
         print(Fore.RED + "No SQL query provided!")
         return
 
-    # Optional EXPLAIN ANALYZE
+    dialect = input("SQL dialect (postgres/mysql/sqlite) [postgres]: ").strip().lower() or "postgres"
+    if dialect not in DIALECTS:
+        print(Fore.RED + f"Unsupported dialect: {dialect}")
+        return
+
+    # Optional EXPLAIN output
     explain_text = None
-    if input("Paste EXPLAIN ANALYZE output? (y/N): ").strip().lower() == "y":
-        print(Fore.CYAN + "Paste EXPLAIN ANALYZE output (end with blank line):")
+    if input(f"Paste {DIALECTS[dialect]} output? (y/N): ").strip().lower() == "y":
+        print(Fore.CYAN + f"Paste {DIALECTS[dialect]} output (end with blank line):")
         explain_lines = []
         while True:
             line = input()
@@ -53,7 +65,7 @@ def main():
     use_ai = input("Include AI explanations? (y/N): ").strip().lower() == "y"
 
     try:
-        expression = parse_one(sql_query)
+        expression = parse_one(sql_query, read=dialect)
     except Exception as e:
         print(Fore.RED + f"Invalid SQL: {e}")
         return
@@ -61,7 +73,8 @@ def main():
     result = analyze_with_explain(
         expression,
         explain_text=explain_text,
-        add_ai_explanations=use_ai
+        add_ai_explanations=use_ai,
+        dialect=dialect
     )
 
     # 🔥 OVERALL SCORE
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from analyzer.explain_analyzer import analyze_plan
+from analyzer.explain_mysql import analyze_mysql_explain
+from analyzer.explain_sqlite import analyze_sqlite_query_plan
+
+
+def types(findings):
+    return {finding["type"] for finding in findings}
+
+
+# ---------------- MySQL ----------------
+MYSQL_JSON = json.dumps({
+    "query_block": {
+        "ordering_operation": {
+            "using_filesort": True,
+            "grouping_operation": {
+                "using_temporary_table": True,
+                "nested_loop": [
+                    {"table": {"table_name": "orders", "access_type": "ALL", "rows_examined_per_scan": 50000}},
+                    {"table": {"table_name": "customers", "access_type": "eq_ref", "rows_examined_per_scan": 1}},
+                ],
+            },
+        }
+    }
+})
+
+MYSQL_TREE = """\
+-> Sort: o.created_at  (cost=1.2e+06 rows=100) (actual time=812.1..820.4 rows=100 loops=1)
+    -> Table scan on o  (cost=101 rows=1000) (actual time=0.04..0.3 rows=20000 loops=1)
+"""
+
+MYSQL_TABULAR = """\
++----+-------------+--------+------------+------+---------------+------+---------+------+-------+----------+-----------------------------+
+| id | select_type | table  | partitions | type | possible_keys | key  | key_len | ref  | rows  | filtered | Extra                       |
++----+-------------+--------+------------+------+---------------+------+---------+------+-------+----------+-----------------------------+
+|  1 | SIMPLE      | orders | NULL       | ALL  | NULL          | NULL | NULL    | NULL | 50000 |    10.00 | Using where; Using filesort |
++----+-------------+--------+------------+------+---------------+------+---------+------+-------+----------+-----------------------------+
+"""
+
+MYSQL_VERTICAL = """\
+*************************** 1. row ***************************
+           id: 1
+  select_type: SIMPLE
+        table: orders
+         type: ALL
+         rows: 120
+        Extra: Using temporary
+"""
+
+
+def test_mysql_json():
+    score, findings = analyze_mysql_explain(MYSQL_JSON)
+    assert types(findings) == {"SEQ_SCAN", "HIGH_ROWS_EXAMINED", "FILESORT", "TEMPORARY_TABLE"}
+    assert findings[0]["message"] == "Full table scan (type: ALL) on orders"
+    assert score == 40
+
+
+def test_mysql_tree():
+    score, findings = analyze_mysql_explain(MYSQL_TREE)
+    assert types(findings) == {"SEQ_SCAN", "HIGH_ROWS_EXAMINED", "FILESORT", "SLOW_QUERY", "BAD_ESTIMATE"}
+    assert findings[0]["message"] == "Full table scan (Table scan) on o"
+    assert score == 10
+
+
+def test_mysql_tabular():
+    score, findings = analyze_mysql_explain(MYSQL_TABULAR)
+    assert types(findings) == {"SEQ_SCAN", "HIGH_ROWS_EXAMINED", "FILESORT"}
+    assert findings[0]["message"] == "Full table scan (type: ALL) on orders"
+    assert score == 50
+
+
+def test_mysql_vertical():
+    _, findings = analyze_mysql_explain(MYSQL_VERTICAL)
+    assert types(findings) == {"SEQ_SCAN", "TEMPORARY_TABLE"}
+
+
+def test_mysql_unrecognized_format_is_reported():
+    _, findings = analyze_mysql_explain("this is not a plan")
+    assert types(findings) == {"UNRECOGNIZED_PLAN"}
+
+
+# ---------------- SQLite ----------------
+SQLITE_MODERN = """\
+QUERY PLAN
+|--SCAN orders
+|--SEARCH customers USING INDEX idx_customers_id (id=?)
+|--SCAN CONSTANT ROW
+`--USE TEMP B-TREE FOR ORDER BY
+"""
+
+SQLITE_LEGACY = """\
+0|0|0|SCAN TABLE orders USING COVERING INDEX idx_orders_status
+0|1|1|SEARCH TABLE customers USING AUTOMATIC COVERING INDEX (id=?)
+0|0|0|USE TEMP B-TREE FOR GROUP BY
+"""
+
+
+def test_sqlite_modern():
+    score, findings = analyze_sqlite_query_plan(SQLITE_MODERN)
+    assert types(findings) == {"SEQ_SCAN", "TEMP_BTREE"}
+    assert findings[0]["message"] == "Full table scan on orders"
+    assert score == 65
+
+
+def test_sqlite_legacy():
+    score, findings = analyze_sqlite_query_plan(SQLITE_LEGACY)
+    assert types(findings) == {"AUTOMATIC_INDEX", "TEMP_BTREE"}
+    assert score == 75
+
+
+# ---------------- Registry ----------------
+def test_analyze_plan_dispatches_by_dialect():
+    assert types(analyze_plan("Seq Scan on orders", None)[1]) == {"SEQ_SCAN"}
+    assert types(analyze_plan(SQLITE_MODERN, "sqlite")[1]) == {"SEQ_SCAN", "TEMP_BTREE"}
+    assert types(analyze_plan(MYSQL_TABULAR, "mysql")[1]) == {"SEQ_SCAN", "HIGH_ROWS_EXAMINED", "FILESORT"}
+
+
+def test_analyze_plan_rejects_unknown_dialect():
+    with pytest.raises(ValueError):
+        analyze_plan("anything", "bigquery")
@@ -0,0 +1,73 @@
+import analyzer.incremental as incremental
+from analyzer.incremental import IncrementalAnalyzer, split_statements
+
+
+def test_split_respects_quotes_and_comments():
+    sql = "select 1;\n  select ';' -- a;b\n from t; /* ; */ select 2;  \n"
+    assert split_statements(sql) == [
+        ("select 1", 0),
+        ("select ';' -- a;b\n from t", 12),
+        ("/* ; */ select 2", 39),
+    ]
+
+
+def test_split_drops_comment_only_chunks():
+    assert split_statements("-- header only\n/* nothing */\n") == []
+    assert split_statements("select 1;\n-- end") == [("select 1", 0)]
+
+
+def test_split_keeps_dollar_quoted_body_together():
+    sql = (
+        "CREATE FUNCTION f() RETURNS void AS $body$ BEGIN UPDATE t SET a = 1; END $body$ LANGUAGE plpgsql;\n"
+        "SELECT $$a;b$$, $1 FROM t"
+    )
+    statements = split_statements(sql)
+    assert len(statements) == 2
+    assert statements[0][0].endswith("LANGUAGE plpgsql")
+    assert statements[1][0] == "SELECT $$a;b$$, $1 FROM t"
+
+
+def test_split_mysql_backslash_escapes_and_hash_comments():
+    sql = "SELECT 'it\\'s; x' FROM t; # note; here\nSELECT 2"
+    assert [text for text, _ in split_statements(sql, "mysql")] == [
+        "SELECT 'it\\'s; x' FROM t",
+        "# note; here\nSELECT 2",
+    ]
+    assert split_statements("# only a comment; still a comment", "mysql") == []
+
+
+def test_split_dollar_quotes_only_for_postgres():
+    sql = "SELECT $$a;b$$"
+    assert len(split_statements(sql)) == 1
+    assert len(split_statements(sql, "mysql")) == 2
+
+
+def test_update_reuses_unchanged_statements():
+    analyzer = IncrementalAnalyzer()
+    first = analyzer.update("file:///a.sql", "select id from t where id = 1;\nselect * from u")
+    second = analyzer.update("file:///a.sql", "select id from t where id = 1;\nselect * from v")
+
+    assert second[0]["issues"] is first[0]["issues"]
+    assert second[1]["issues"] is not first[1]["issues"]
+
+
+def test_trailing_comment_produces_no_error():
+    statements = IncrementalAnalyzer().update("file:///a.sql", "select id from t where id = 1;\n-- end")
+    assert len(statements) == 1
+    assert statements[0]["error"] is None
+
+
+def test_analysis_failure_is_reported_per_statement(monkeypatch):
+    real_analyze = incremental.analyze
+
+    def flaky_analyze(expression, **kwargs):
+        if "boom" in expression.sql():
+            raise RuntimeError("rule crashed")
+        return real_analyze(expression, **kwargs)
+
+    monkeypatch.setattr(incremental, "analyze", flaky_analyze)
+    statements = IncrementalAnalyzer().update("file:///a.sql", "select boom from t;\nselect * from u")
+
+    assert statements[0]["error"] == "Analysis failed: rule crashed"
+    assert statements[1]["error"] is None
+    assert statements[1]["issues"]
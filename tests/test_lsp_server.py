@@ -0,0 +1,74 @@
+import io
+import json
+
+from lsp_server import (
+    SqlLanguageServer,
+    build_code_actions,
+    offset_to_position,
+    read_message,
+    write_message,
+)
+from analyzer.incremental import IncrementalAnalyzer
+
+URI = "file:///report.sql"
+WHOLE_FILE = {"start": {"line": 0, "character": 0}, "end": {"line": 99, "character": 0}}
+
+
+def frame(*messages):
+    stream = io.BytesIO()
+    for message in messages:
+        write_message(stream, {"jsonrpc": "2.0", **message})
+    stream.seek(0)
+    return stream
+
+
+def read_all(stream):
+    stream.seek(0)
+    messages = []
+    while True:
+        message = read_message(stream)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def test_offset_to_position_counts_utf16_units():
+    text = "-- 🚀 report\nselect 1"
+    assert offset_to_position(text, text.index("report")) == {"line": 0, "character": 6}
+    assert offset_to_position(text, text.index("select")) == {"line": 1, "character": 0}
+
+
+def test_code_action_only_when_rewrite_changes_query():
+    analyzer = IncrementalAnalyzer()
+
+    text = "-- daily report\nselect id from users where upper(email) = 'A@B.COM'"
+    statements = analyzer.update(URI, text)
+    actions = build_code_actions(URI, text, statements, WHOLE_FILE)
+    assert len(actions) == 1
+    new_text = actions[0]["edit"]["changes"][URI][0]["newText"]
+    assert "UPPER(" not in new_text
+    assert "email ILIKE 'A@B.COM'" in new_text
+
+    text = "select id from users where upper(email) = lower(name)"
+    statements = analyzer.update(URI, text)
+    assert build_code_actions(URI, text, statements, WHOLE_FILE) == []
+
+
+def test_server_publishes_diagnostics_and_survives_bad_notification():
+    stdin = frame(
+        {"id": 1, "method": "initialize", "params": {}},
+        {"method": "textDocument/didOpen", "params": {}},
+        {"method": "textDocument/didOpen", "params": {"textDocument": {"uri": URI, "text": "select * from t"}}},
+        {"id": 2, "method": "shutdown"},
+        {"method": "exit"},
+    )
+    stdout = io.BytesIO()
+    SqlLanguageServer(stdin, stdout).serve()
+
+    messages = read_all(stdout)
+    assert messages[0]["id"] == 1
+    published = [m for m in messages if m.get("method") == "textDocument/publishDiagnostics"]
+    assert len(published) == 1
+    codes = {d["code"] for d in published[0]["params"]["diagnostics"]}
+    assert {"OVER_FETCHING", "FULL_TABLE_SCAN"} <= codes
+    assert messages[-1] == {"jsonrpc": "2.0", "id": 2, "result": None}
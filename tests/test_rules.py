@@ -0,0 +1,73 @@
+import pytest
+from sqlglot import parse_one
+
+from analyzer.rules import detect_non_sargable_patterns, generate_optimized_condition, rewrite_query
+
+SQL = (
+    "SELECT id FROM users WHERE UPPER(email) = 'A@B.COM' "
+    "AND DATE(created_at) = '2025-12-18' AND YEAR(created_at) = 2024"
+)
+
+EXPECTED_UPPER = {
+    None: "email ILIKE 'A@B.COM'",
+    "postgres": "email ILIKE 'A@B.COM'",
+    "mysql": "email = 'A@B.COM'",
+    "sqlite": "email = 'A@B.COM' COLLATE NOCASE",
+}
+
+
+@pytest.mark.parametrize("dialect", [None, "postgres", "mysql", "sqlite"])
+def test_patterns_use_function_name_and_value(dialect):
+    patterns = detect_non_sargable_patterns(parse_one(SQL, read=dialect), default_table="users")
+    found = {(p["pattern"], p["column"], p["value"]) for p in patterns}
+    assert found == {
+        ("UPPER", "email", "A@B.COM"),
+        ("DATE", "created_at", "2025-12-18"),
+        ("YEAR", "created_at", "2024"),
+    }
+
+
+@pytest.mark.parametrize("dialect", [None, "postgres", "mysql", "sqlite"])
+def test_rewrite_per_dialect(dialect):
+    expression = parse_one(SQL, read=dialect)
+    patterns = detect_non_sargable_patterns(expression, default_table="users")
+    rewritten = rewrite_query(expression, patterns, dialect)
+
+    assert EXPECTED_UPPER[dialect] in rewritten
+    assert "created_at BETWEEN '2025-12-18 00:00:00' AND '2025-12-18 23:59:59'" in rewritten
+    assert "created_at BETWEEN '2024-01-01 00:00:00' AND '2024-12-31 23:59:59'" in rewritten
+    assert "UPPER(" not in rewritten
+    # The analyzed expression itself is not modified
+    assert "UPPER(" in expression.sql(dialect=dialect)
+
+
+def test_upper_condition_per_dialect():
+    info = {"pattern": "UPPER", "column": "email", "value": "x"}
+    assert generate_optimized_condition(info) == "email ILIKE 'x'"
+    assert generate_optimized_condition(info, "mysql") == "email = 'x'"
+    assert generate_optimized_condition(info, "sqlite") == "email = 'x' COLLATE NOCASE"
+
+
+def test_rewrite_keeps_table_qualifier():
+    expression = parse_one("SELECT id FROM users AS u WHERE UPPER(u.email) = 'X'")
+    patterns = detect_non_sargable_patterns(expression)
+    assert "u.email ILIKE 'X'" in rewrite_query(expression, patterns)
+
+
+def test_rewrite_quotes_values_with_embedded_quotes():
+    expression = parse_one("SELECT id FROM users WHERE UPPER(name) = 'O''BRIEN'")
+    patterns = detect_non_sargable_patterns(expression)
+    assert rewrite_query(expression, patterns) == "SELECT id FROM users WHERE name ILIKE 'O''BRIEN'"
+    assert generate_optimized_condition(patterns[0]) == "name ILIKE 'O''BRIEN'"
+
+
+@pytest.mark.parametrize("dialect, condition", [
+    (None, "UPPER(TRIM(email)) = 'X'"),
+    ("mysql", "UPPER(TRIM(email)) = 'X'"),
+    ("mysql", "YEAR(DATE_ADD(created_at, INTERVAL 1 DAY)) = 2024"),
+])
+def test_nested_functions_are_not_rewritten(dialect, condition):
+    expression = parse_one(f"SELECT id FROM users WHERE {condition}", read=dialect)
+    patterns = detect_non_sargable_patterns(expression)
+    assert patterns == []
+    assert rewrite_query(expression, patterns, dialect) == expression.sql(dialect=dialect)
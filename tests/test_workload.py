@@ -0,0 +1,125 @@
+import pytest
+from sqlglot import parse_one
+
+from analyzer.advisor import analyze_with_explain, analyze_workload
+from analyzer.workload import detect_workload_opportunities, fingerprint_query
+
+REPORT = (
+    "SELECT c.region, SUM(o.total) FROM orders AS o JOIN customers AS c ON c.id = o.customer_id "
+    "WHERE o.created_at > {value} GROUP BY c.region"
+)
+
+
+def workload(*queries, **extra):
+    return {"queries": list(queries), "window_hours": 1, **extra}
+
+
+def test_fingerprint_collapses_in_lists_and_ignores_dialect():
+    fingerprints = {
+        fingerprint_query(parse_one(sql, read=dialect))[0]
+        for sql in ("SELECT a FROM t WHERE x IN (1, 2)", "SELECT a FROM t WHERE x IN (1, 2, 3)")
+        for dialect in (None, "postgres")
+    }
+    assert len(fingerprints) == 1
+
+
+def test_literal_variants_and_bind_parameters_share_a_fingerprint():
+    issues = detect_workload_opportunities(workload(
+        {"sql": REPORT.format(value="'2025-01-01'"), "calls": 2000, "mean_time_ms": 120},
+        {"sql": REPORT.format(value="'2025-02-01'"), "calls": 1000, "mean_time_ms": 150},
+        {"sql": REPORT.format(value="$1"), "calls": 1000, "mean_time_ms": 150},
+    ), "postgres")
+
+    assert len(issues) == 1
+    assert issues[0]["calls_per_hour"] == 4000
+    assert issues[0]["suggestion"].startswith("Maintain a summary table")
+
+
+def test_pg_stat_statements_query_never_gets_literal_view_ddl():
+    issues = detect_workload_opportunities(workload(
+        {"sql": REPORT.format(value="$1"), "calls": 3000, "mean_time_ms": 130},
+    ))
+    assert issues[0]["type"] == "MATERIALIZED_VIEW_OPPORTUNITY"
+    assert "CREATE MATERIALIZED VIEW" not in issues[0]["suggestion"]
+
+
+def test_fully_literal_aggregate_gets_view_ddl_per_dialect():
+    query = {"sql": "SELECT status, COUNT(*) FROM orders GROUP BY status", "calls": 500, "mean_time_ms": 300}
+
+    postgres = detect_workload_opportunities(workload(query))[0]
+    assert postgres["suggestion"].startswith("CREATE MATERIALIZED VIEW mv_")
+
+    mysql = detect_workload_opportunities(workload(query), "mysql")[0]
+    assert mysql["suggestion"].startswith("CREATE TABLE summary_")
+
+
+def test_time_saved_accounts_for_table_writes():
+    issue = detect_workload_opportunities(workload(
+        {"sql": "SELECT status, COUNT(*) FROM orders GROUP BY status", "calls": 500, "mean_time_ms": 300},
+        table_writes_per_hour={"orders": 20},
+    ))[0]
+    assert issue["estimated_time_saved_ms_per_hour"] == (500 - 20) * 300
+    assert issue["severity"] == "HIGH"
+
+
+def test_skips_frequently_written_cheap_and_write_queries():
+    assert detect_workload_opportunities(workload(
+        {"sql": "SELECT status, COUNT(*) FROM orders GROUP BY status", "calls": 500, "mean_time_ms": 300},
+        {"sql": "SELECT a FROM t JOIN u ON u.id = t.id", "calls": 5000, "mean_time_ms": 1},
+        {"sql": "UPDATE orders SET status = 'x'", "calls": 5000, "mean_time_ms": 300},
+        table_writes_per_hour={"orders": 1000},
+    )) == []
+
+
+def test_join_without_aggregate_suggests_result_cache():
+    issue = detect_workload_opportunities(workload(
+        {"sql": "SELECT * FROM users AS u JOIN teams AS t ON t.id = u.team_id WHERE u.id = 5",
+         "calls": 900, "mean_time_ms": 80},
+    ))[0]
+    assert issue["type"] == "RESULT_CACHE_OPPORTUNITY"
+    assert issue["scope"] == "workload"
+
+
+def test_analyze_with_explain_reports_only_matching_fingerprint():
+    wl = workload(
+        {"sql": "SELECT status, COUNT(*) FROM orders GROUP BY status", "calls": 500, "mean_time_ms": 300},
+        {"sql": "SELECT * FROM users AS u JOIN teams AS t ON t.id = u.team_id WHERE u.id = 5",
+         "calls": 900, "mean_time_ms": 80},
+    )
+    result = analyze_with_explain(parse_one("SELECT status, COUNT(*) FROM orders GROUP BY status"), workload=wl)
+    workload_issues = [issue for issue in result["issues"] if issue.get("scope") == "workload"]
+    assert [issue["type"] for issue in workload_issues] == ["MATERIALIZED_VIEW_OPPORTUNITY"]
+
+    summary = analyze_workload(wl)
+    assert len(summary["issues"]) == 2
+    assert summary["estimated_time_saved_ms_per_hour"] == sum(
+        issue["estimated_time_saved_ms_per_hour"] for issue in summary["issues"]
+    )
+
+
+def test_fingerprint_ignores_identifier_quoting_and_case():
+    quoted = parse_one("SELECT `status`, COUNT(*) FROM `Orders` GROUP BY `status`", read="mysql")
+    plain = parse_one("select STATUS, count(*) from orders group by status", read="mysql")
+    assert fingerprint_query(quoted, "mysql")[0] == fingerprint_query(plain, "mysql")[0]
+
+
+def test_digest_text_matches_user_query_and_write_rates_ignore_case():
+    wl = workload(
+        {"sql": "SELECT `status`, COUNT(*) FROM `orders` GROUP BY `status`", "calls": 500, "mean_time_ms": 300},
+        table_writes_per_hour={"Orders": 20},
+    )
+    result = analyze_with_explain(
+        parse_one("SELECT status, COUNT(*) FROM ORDERS GROUP BY status", read="mysql"),
+        dialect="mysql",
+        workload=wl,
+    )
+    workload_issues = [issue for issue in result["issues"] if issue.get("scope") == "workload"]
+    assert len(workload_issues) == 1
+    assert workload_issues[0]["estimated_time_saved_ms_per_hour"] == (500 - 20) * 300
+
+
+@pytest.mark.parametrize("window_hours", [0, -1, None])
+def test_non_positive_window_is_rejected(window_hours):
+    query = {"sql": "SELECT status, COUNT(*) FROM orders GROUP BY status", "calls": 500, "mean_time_ms": 300}
+    with pytest.raises(ValueError):
+        detect_workload_opportunities({"queries": [query], "window_hours": window_hours})